@@ -80,4 +80,10 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
 }
 
+# Optional overrides for top-rated/trending rankings; defaults live in events/rankings.py
+# EVENT_RANKINGS = {
+#     'PRIOR_WEIGHT': 10,
+#     'TRENDING_WINDOW': timedelta(days=3),
+# }
+
 AUTH_USER_MODEL = 'events.UserProfile'
\ No newline at end of file
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import UserProfile, Event, RSVP, Review
+from .models import UserProfile, Event, EventRanking, RSVP, Review
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
@@ -20,3 +20,8 @@ class RSVPAdmin(admin.ModelAdmin):
 class ReviewAdmin(admin.ModelAdmin):
     list_display = ('event', 'user', 'rating', 'created_at')
     list_filter = ('rating',)
+
+@admin.register(EventRanking)
+class EventRankingAdmin(admin.ModelAdmin):
+    list_display = ('event', 'location', 'start_time', 'score', 'review_count', 'recent_going_count')
+    list_filter = ('location',)
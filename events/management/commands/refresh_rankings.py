@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from events.rankings import rebuild_rankings
+
+
+# Periodic job: recomputes all event rankings so trending scores decay over time
+class Command(BaseCommand):
+    help = "Rebuild the precomputed top-rated and trending event rankings."
+
+    def handle(self, *args, **options):
+        count = rebuild_rankings()
+        self.stdout.write(self.style.SUCCESS(f"Refreshed rankings for {count} events."))
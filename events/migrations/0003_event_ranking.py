@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-19 20:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_alter_review_rating'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rsvp',
+            name='going_since',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='EventRanking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('location', models.CharField(max_length=100)),
+                ('start_time', models.DateTimeField()),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('score', models.FloatField(default=0)),
+                ('going_count', models.PositiveIntegerField(default=0)),
+                ('recent_going_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='ranking', to='events.event')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('review_count__gt', 0)), fields=['-score', 'start_time', 'event'], name='ranking_score_idx'), models.Index(condition=models.Q(('review_count__gt', 0)), fields=['location', '-score', 'start_time', 'event'], name='ranking_loc_score_idx'), models.Index(condition=models.Q(('recent_going_count__gt', 0)), fields=['-recent_going_count', 'start_time', 'event'], name='ranking_trending_idx'), models.Index(condition=models.Q(('recent_going_count__gt', 0)), fields=['location', '-recent_going_count', 'start_time', 'event'], name='ranking_loc_trending_idx')],
+            },
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
 
 
 # Custom user model extending Django’s AbstractUser
@@ -42,10 +43,23 @@ class RSVP(models.Model):
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='rsvps')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='rsvps')
     status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    going_since = models.DateTimeField(null=True, blank=True)  # When status last became 'Going'
 
     def __str__(self):
         return f"{self.user.username} - {self.event.title} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        # Only a change to 'Going' starts the clock; re-submitting the same status keeps it
+        if self.status != 'Going':
+            self.going_since = None
+        elif self.going_since is None:
+            self.going_since = timezone.now()
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'status' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'going_since'}
+        super().save(*args, **kwargs)
+
     class Meta:
         unique_together = ('event', 'user')  # Ensures a user RSVPs only once per event
 
@@ -63,3 +77,36 @@ class Review(models.Model):
 
     class Meta:
         unique_together = ('event', 'user')  # Each user can review an event only once
+
+
+# Precomputed ranking scores per public event, refreshed from RSVP/review writes
+class EventRanking(models.Model):
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name='ranking')
+    location = models.CharField(max_length=100)
+    start_time = models.DateTimeField()
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    score = models.FloatField(default=0)  # Bayesian-smoothed average rating
+    going_count = models.PositiveIntegerField(default=0)
+    recent_going_count = models.PositiveIntegerField(default=0)  # 'Going' RSVPs within the trending window
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Ranking for {self.event.title}"
+
+    @property
+    def average_rating(self):
+        return self.rating_sum / self.review_count if self.review_count else None
+
+    class Meta:
+        # Partial indexes matching the top-rated/trending list views, in their exact ORDER BY
+        indexes = [
+            models.Index(fields=['-score', 'start_time', 'event'], name='ranking_score_idx',
+                         condition=models.Q(review_count__gt=0)),
+            models.Index(fields=['location', '-score', 'start_time', 'event'], name='ranking_loc_score_idx',
+                         condition=models.Q(review_count__gt=0)),
+            models.Index(fields=['-recent_going_count', 'start_time', 'event'], name='ranking_trending_idx',
+                         condition=models.Q(recent_going_count__gt=0)),
+            models.Index(fields=['location', '-recent_going_count', 'start_time', 'event'],
+                         name='ranking_loc_trending_idx', condition=models.Q(recent_going_count__gt=0)),
+        ]
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from .models import Event, EventRanking, RSVP, Review
+
+# Authoritative defaults; individual keys can be overridden via settings.EVENT_RANKINGS
+DEFAULT_RANKING_SETTINGS = {
+    'PRIOR_MEAN': 3.0,           # Rating assumed for an event before any reviews
+    'PRIOR_WEIGHT': 5,           # How many reviews the prior is worth
+    'TRENDING_WINDOW': timedelta(days=7),
+}
+
+
+def ranking_setting(name):
+    return getattr(settings, 'EVENT_RANKINGS', {}).get(name, DEFAULT_RANKING_SETTINGS[name])
+
+
+# Bayesian average: pulls events with few reviews towards the prior mean
+def bayesian_score(rating_sum, review_count):
+    prior_mean = ranking_setting('PRIOR_MEAN')
+    prior_weight = ranking_setting('PRIOR_WEIGHT')
+    return (prior_weight * prior_mean + rating_sum) / (prior_weight + review_count)
+
+
+def _ranking_fields(event, review_count, rating_sum, going_count, recent_going_count):
+    return {
+        'location': event.location,
+        'start_time': event.start_time,
+        'review_count': review_count,
+        'rating_sum': rating_sum,
+        'score': bayesian_score(rating_sum, review_count),
+        'going_count': going_count,
+        'recent_going_count': recent_going_count,
+    }
+
+
+# Only upcoming public events are ranked, which keeps the ranking table small
+def rankable_events(now):
+    return Event.objects.filter(is_public=True, start_time__gte=now)
+
+
+# Recomputes the ranking row of a single event (called on RSVP/review/event writes)
+def refresh_event_ranking(event_id):
+    now = timezone.now()
+    event = rankable_events(now).filter(id=event_id).first()
+    if event is None:
+        # Deleted, private or past events are not ranked
+        EventRanking.objects.filter(event_id=event_id).delete()
+        return None
+
+    since = now - ranking_setting('TRENDING_WINDOW')
+    reviews = Review.objects.filter(event=event).aggregate(count=Count('id'), total=Sum('rating'))
+    rsvps = RSVP.objects.filter(event=event, status='Going').aggregate(
+        going=Count('id'),
+        recent=Count('id', filter=Q(going_since__gte=since)),
+    )
+
+    ranking, _ = EventRanking.objects.update_or_create(
+        event=event,
+        defaults=_ranking_fields(event, reviews['count'], reviews['total'] or 0,
+                                 rsvps['going'], rsvps['recent']),
+    )
+    return ranking
+
+
+# Rebuilds every ranking row; run periodically so the trending window keeps sliding
+# and events that have started drop out of the table
+@transaction.atomic
+def rebuild_rankings():
+    now = timezone.now()
+    since = now - ranking_setting('TRENDING_WINDOW')
+    rankable = rankable_events(now)
+    events = list(rankable)
+
+    reviews = {
+        row['event_id']: row
+        for row in Review.objects.filter(event__in=rankable).values('event_id').annotate(
+            count=Count('id'), total=Sum('rating'),
+        )
+    }
+    rsvps = {
+        row['event_id']: row
+        for row in RSVP.objects.filter(event__in=rankable, status='Going').values('event_id').annotate(
+            going=Count('id'),
+            recent=Count('id', filter=Q(going_since__gte=since)),
+        )
+    }
+
+    rankings = []
+    for event in events:
+        review_row = reviews.get(event.id, {})
+        rsvp_row = rsvps.get(event.id, {})
+        rankings.append(EventRanking(event=event, **_ranking_fields(
+            event,
+            review_row.get('count', 0),
+            review_row.get('total') or 0,
+            rsvp_row.get('going', 0),
+            rsvp_row.get('recent', 0),
+        )))
+
+    # Drop rows for events that became private or have already started
+    EventRanking.objects.exclude(event__in=rankable).delete()
+    EventRanking.objects.bulk_create(
+        rankings,
+        update_conflicts=True,
+        unique_fields=['event'],
+        update_fields=['location', 'start_time', 'review_count', 'rating_sum', 'score',
+                       'going_count', 'recent_going_count', 'updated_at'],
+    )
+    return len(rankings)
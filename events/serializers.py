@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Event, RSVP, Review, UserProfile
+from .models import Event, EventRanking, RSVP, Review, UserProfile
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -40,3 +40,15 @@ class ReviewSerializer(serializers.ModelSerializer):
     class Meta:
         model = Review
         fields = '__all__'
+
+
+# Read-only view of precomputed event rankings
+class EventRankingSerializer(serializers.ModelSerializer):
+    event = serializers.ReadOnlyField(source='event.id')
+    title = serializers.ReadOnlyField(source='event.title')
+    average_rating = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = EventRanking
+        fields = ('event', 'title', 'location', 'start_time', 'score', 'average_rating',
+                  'review_count', 'going_count', 'recent_going_count')
@@ -0,0 +1,57 @@
+import threading
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Event, RSVP, Review
+from .rankings import refresh_event_ranking
+
+# Event ids awaiting a ranking refresh, per thread and database alias
+_pending = threading.local()
+
+
+def _pending_event_ids(using):
+    if not hasattr(_pending, 'event_ids'):
+        _pending.event_ids = {}
+    return _pending.event_ids.setdefault(using, set())
+
+
+def _flush_pending(using):
+    # The first callback after a commit refreshes every pending event; the rest find nothing to do
+    event_ids = _pending_event_ids(using)
+    while event_ids:
+        refresh_event_ranking(event_ids.pop())
+
+
+# Refresh after commit (or right away in autocommit) so rolled-back writes don't touch the ranking
+# table. Ids left behind by a rollback just get an extra refresh on the next flush.
+def _schedule_refresh(event_id, using):
+    _pending_event_ids(using).add(event_id)
+    transaction.on_commit(lambda: _flush_pending(using), using=using)
+
+
+def _deleted_with_event(origin):
+    # The Event's OneToOne ranking row is removed by the same cascade
+    if isinstance(origin, QuerySet):
+        return origin.model is Event
+    return isinstance(origin, Event)
+
+
+@receiver(post_save, sender=Event)
+def refresh_ranking_on_event_save(sender, instance, using, **kwargs):
+    _schedule_refresh(instance.id, using)
+
+
+@receiver(post_save, sender=RSVP)
+@receiver(post_save, sender=Review)
+def refresh_ranking_on_activity(sender, instance, using, **kwargs):
+    _schedule_refresh(instance.event_id, using)
+
+
+@receiver(post_delete, sender=RSVP)
+@receiver(post_delete, sender=Review)
+def refresh_ranking_on_activity_delete(sender, instance, using, origin=None, **kwargs):
+    if not _deleted_with_event(origin):
+        _schedule_refresh(instance.event_id, using)
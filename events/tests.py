@@ -1,8 +1,14 @@
+from datetime import timedelta
+from io import StringIO
 from django.contrib.auth import get_user_model # <-- CHANGED THIS LINE
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
-from .models import Event, RSVP, Review
+from rest_framework.test import APITestCase, APITransactionTestCase
+from .models import Event, EventRanking, RSVP, Review
 
 User = get_user_model() # <-- ADDED THIS LINE
 
@@ -161,4 +167,166 @@ class EventManagementTests(APITestCase):
             "is_public": True
         }
         resp = self.client.post(reverse('event-list'), data, format='json')
-        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # ------------------- Ranking Tests -------------------
+
+    def _create_upcoming_event(self, title, location="Mumbai"):
+        start = timezone.now() + timedelta(days=30)
+        with self.captureOnCommitCallbacks(execute=True):
+            return Event.objects.create(
+                organizer=self.user, title=title, description="Upcoming", location=location,
+                start_time=start, end_time=start + timedelta(hours=8), is_public=True
+            )
+
+    def test_top_rated_uses_bayesian_score(self):
+        """A single 5-star review should not outrank many strong reviews"""
+        popular = self._create_upcoming_event("Popular Meetup")
+        niche = self._create_upcoming_event("Niche Meetup")
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(6):
+                reviewer = User.objects.create_user(username=f"reviewer{i}", password="pass1234")
+                Review.objects.create(event=popular, user=reviewer, rating=5 if i % 2 else 4)
+            Review.objects.create(event=niche, user=self.user2, rating=5)
+
+        response = self.client.get(reverse('event-top-rated'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['title'] for row in response.data['results']], ["Popular Meetup", "Niche Meetup"])
+        self.assertEqual(response.data['results'][1]['average_rating'], 5.0)
+
+    def test_trending_filters_by_location(self):
+        """Trending lists upcoming events with recent RSVPs, optionally per location"""
+        mumbai = self._create_upcoming_event("Mumbai Meetup")
+        pune = self._create_upcoming_event("Pune Meetup", location="Pune")
+        with self.captureOnCommitCallbacks(execute=True):
+            RSVP.objects.create(event=mumbai, user=self.user2, status="Going")
+            RSVP.objects.create(event=pune, user=self.user2, status="Going")
+            RSVP.objects.create(event=pune, user=self.user, status="Going")
+
+        response = self.client.get(reverse('event-trending'))
+        self.assertEqual([row['title'] for row in response.data['results']], ["Pune Meetup", "Mumbai Meetup"])
+
+        response = self.client.get(reverse('event-trending'), {'location': 'Mumbai'})
+        self.assertEqual([row['title'] for row in response.data['results']], ["Mumbai Meetup"])
+        self.assertEqual(response.data['results'][0]['recent_going_count'], 1)
+
+    def test_repeated_going_rsvp_does_not_count_as_recent(self):
+        """Re-submitting 'Going' keeps the original going_since; only a status change resets it"""
+        event = self._create_upcoming_event("Meetup")
+        url = reverse('event-rsvp', kwargs={'event_id': event.id})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, {"status": "Going"}, format='json')
+        old = timezone.now() - timedelta(days=30)
+        RSVP.objects.filter(event=event).update(going_since=old)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, {"status": "Going"}, format='json')
+        self.assertEqual(RSVP.objects.get(event=event).going_since, old)
+        self.assertEqual(EventRanking.objects.get(event=event).recent_going_count, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, {"status": "Maybe"}, format='json')
+        self.assertIsNone(RSVP.objects.get(event=event).going_since)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, {"status": "Going"}, format='json')
+        self.assertGreater(RSVP.objects.get(event=event).going_since, old)
+        self.assertEqual(EventRanking.objects.get(event=event).recent_going_count, 1)
+
+    def test_rankings_refresh_and_rebuild(self):
+        """Private and past events drop out of rankings; the periodic job decays stale RSVPs"""
+        event = self._create_upcoming_event("Meetup")
+        with self.captureOnCommitCallbacks(execute=True):
+            RSVP.objects.create(event=event, user=self.user2, status="Going")
+        self.assertEqual(EventRanking.objects.get(event=event).recent_going_count, 1)
+
+        RSVP.objects.filter(event=event).update(going_since=timezone.now() - timedelta(days=30))
+        EventRanking.objects.create(event=self.event, location=self.event.location, start_time=self.event.start_time)
+        call_command('refresh_rankings', stdout=StringIO())
+        ranking = EventRanking.objects.get(event=event)
+        self.assertEqual((ranking.going_count, ranking.recent_going_count), (1, 0))
+        self.assertFalse(EventRanking.objects.filter(event=self.event).exists())  # Already started
+
+        with self.captureOnCommitCallbacks(execute=True):
+            event.is_public = False
+            event.save()
+        self.assertFalse(EventRanking.objects.filter(event=event).exists())
+
+    def test_event_delete_query_count_is_bounded(self):
+        """Cascading RSVP/review deletes must not trigger a ranking refresh per row"""
+        event = self._create_upcoming_event("Big Meetup")
+        attendees = User.objects.bulk_create([User(username=f"attendee{i}") for i in range(100)])
+        RSVP.objects.bulk_create([RSVP(event=event, user=user, status="Going") for user in attendees])
+        Review.objects.bulk_create([Review(event=event, user=user, rating=4) for user in attendees])
+
+        with CaptureQueriesContext(connection) as ctx:
+            with self.captureOnCommitCallbacks(execute=True):
+                event.delete()
+        self.assertLess(len(ctx.captured_queries), 20)
+        self.assertFalse(EventRanking.objects.filter(event_id=event.id).exists())
+
+    def test_user_delete_refreshes_affected_rankings(self):
+        """Reviews removed by a user cascade are reflected in the event's ranking"""
+        event = self._create_upcoming_event("Meetup")
+        with self.captureOnCommitCallbacks(execute=True):
+            Review.objects.create(event=event, user=self.user2, rating=5)
+            RSVP.objects.create(event=event, user=self.user2, status="Going")
+        self.assertEqual(EventRanking.objects.get(event=event).review_count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user2.delete()
+        ranking = EventRanking.objects.get(event=event)
+        self.assertEqual((ranking.review_count, ranking.going_count), (0, 0))
+
+
+# Runs without a wrapping transaction, so ranking refreshes fire in autocommit as in production
+class EventRankingAutocommitTests(APITransactionTestCase):
+    def setUp(self):
+        self.organizer = User.objects.create_user(username="organizer", password="pass1234")
+        self.reviewer = User.objects.create_user(username="reviewer", password="pass1234")
+        start = timezone.now() + timedelta(days=30)
+        self.event = Event.objects.create(
+            organizer=self.organizer, title="Meetup", description="Upcoming", location="Mumbai",
+            start_time=start, end_time=start + timedelta(hours=8), is_public=True
+        )
+
+    def _authenticate(self, username):
+        response = self.client.post(reverse('token_obtain_pair'), {
+            'username': username,
+            'password': 'pass1234'
+        })
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_review_refreshes_ranking(self):
+        """Posting a review through the API updates the event's ranking row"""
+        self.assertTrue(EventRanking.objects.filter(event=self.event).exists())
+
+        self._authenticate("reviewer")
+        response = self.client.post(
+            reverse('event-reviews', kwargs={'event_id': self.event.id}),
+            {"rating": 5, "comment": "Great"},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        ranking = EventRanking.objects.get(event=self.event)
+        self.assertEqual((ranking.review_count, ranking.rating_sum), (1, 5))
+        response = self.client.get(reverse('event-top-rated'))
+        self.assertEqual([row['title'] for row in response.data['results']], ["Meetup"])
+
+    def test_private_event_leaves_rankings(self):
+        """Making an event private through the API removes it from public rankings"""
+        Review.objects.create(event=self.event, user=self.reviewer, rating=5)
+        self.assertEqual(EventRanking.objects.get(event=self.event).review_count, 1)
+
+        self._authenticate("organizer")
+        response = self.client.patch(
+            reverse('event-detail', kwargs={'pk': self.event.id}),
+            {"is_public": False},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(EventRanking.objects.filter(event=self.event).exists())
+
+        self.client.credentials()
+        response = self.client.get(reverse('event-top-rated'))
+        self.assertEqual(response.data['results'], [])
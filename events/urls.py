@@ -1,12 +1,15 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import EventViewSet, RSVPViewSet, ReviewListCreateView
+from .views import EventViewSet, RSVPViewSet, ReviewListCreateView, TopRatedEventListView, TrendingEventListView
 
 # Router for standard CRUD routes
 router = DefaultRouter()
 router.register(r'events', EventViewSet, basename='event')
 
 urlpatterns = [
+    # Declared before the router so these paths aren't captured by the event detail route
+    path('events/top-rated/', TopRatedEventListView.as_view(), name='event-top-rated'),
+    path('events/trending/', TrendingEventListView.as_view(), name='event-trending'),
     path('', include(router.urls)),
     path('events/<int:event_id>/rsvp/', RSVPViewSet.as_view(), name='event-rsvp'),
     path('events/<int:event_id>/reviews/', ReviewListCreateView.as_view(), name='event-reviews'),
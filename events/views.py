@@ -1,8 +1,9 @@
 from rest_framework import viewsets, generics, permissions, status
-from .models import Event, RSVP, Review
-from .serializers import EventSerializer, RSVPSerializer, ReviewSerializer
+from .models import Event, EventRanking, RSVP, Review
+from .serializers import EventSerializer, EventRankingSerializer, RSVPSerializer, ReviewSerializer
 from .permissions import IsOrganizerOrReadOnly, IsInvitedOrPublic
 from rest_framework.response import Response
+from django.utils import timezone
 
 
 # Handles all CRUD operations for Events
@@ -63,3 +64,36 @@ class ReviewListCreateView(generics.ListCreateAPIView):
 
     def perform_create(self, serializer):
         serializer.save(event_id=self.kwargs['event_id'], user=self.request.user)
+
+
+# Base view for upcoming public events read from the precomputed ranking table
+class EventRankingListView(generics.ListAPIView):
+    serializer_class = EventRankingSerializer
+    permission_classes = [permissions.AllowAny]
+    ranking_order = ()
+
+    def get_queryset(self):
+        # Re-check visibility so a stale ranking row can never expose a private event
+        queryset = EventRanking.objects.select_related('event').filter(
+            start_time__gte=timezone.now(), event__is_public=True
+        )
+        location = self.request.query_params.get('location')
+        if location:
+            queryset = queryset.filter(location=location)
+        return queryset.order_by(*self.ranking_order)
+
+
+# Lists upcoming events by Bayesian-smoothed rating
+class TopRatedEventListView(EventRankingListView):
+    ranking_order = ('-score', 'start_time', 'event_id')
+
+    def get_queryset(self):
+        return super().get_queryset().filter(review_count__gt=0)
+
+
+# Lists upcoming events by 'Going' RSVPs within the trending window
+class TrendingEventListView(EventRankingListView):
+    ranking_order = ('-recent_going_count', 'start_time', 'event_id')
+
+    def get_queryset(self):
+        return super().get_queryset().filter(recent_going_count__gt=0)